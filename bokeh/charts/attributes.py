@@ -1,8 +1,9 @@
 from __future__ import absolute_import
 
-from copy import copy
 from itertools import cycle
 
+import numpy as np
+
 from bokeh.charts import DEFAULT_PALETTE
 from bokeh.charts.properties import ColumnLabel
 from bokeh.charts.utils import marker_types
@@ -83,14 +84,16 @@ class AttrSpec(HasProps):
                 be used to force a specific order for assignment.
             **properties: other properties to pass to parent :class:`HasProps`
         """
+        self._attr_map_stale = True
+        self._key_cache = {}
+
         properties['columns'] = self._ensure_list(columns)
 
         if df is not None:
             properties['data'] = ColumnDataSource(df)
 
         if default is None and iterable is not None:
-            default_iter = copy(iterable)
-            properties['default'] = next(iter(default_iter))
+            properties['default'] = next(iter(iterable))
         elif default is not None:
             properties['default'] = default
 
@@ -125,16 +128,45 @@ class AttrSpec(HasProps):
         self.default = next(self._setup_iterable())
 
     def _setup_iterable(self):
-        """Default behavior is to copy and cycle the provided iterable."""
-        return cycle(copy(self.iterable))
+        """Default behavior is to cycle the provided iterable."""
+        return cycle(self.iterable)
 
     def _generate_items(self, df, columns):
         """Produce list of unique tuples that identify each item."""
         if self.items is None or len(self.items) == 0:
-            if self.sort:
-                df = df.sort(columns=columns, ascending=self.ascending)
+            if len(columns) == 1:
+                # single column, so dedup the series without building a frame
+                items = df[columns[0]].drop_duplicates()
+                if self.sort:
+                    items = items.sort_values(ascending=self.ascending)
+                self.items = [(item,) for item in items]
+                return
+
+            dtypes = set(df[columns].dtypes)
+            dtype = dtypes.pop() if len(dtypes) == 1 else None
+
+            # extension dtypes are excluded, since .values may hold objects
+            if self.sort and isinstance(dtype, np.dtype) and dtype.kind in 'biu':
+                # one integer dtype, so dedup and sort the rows in a single pass
+                self.items = self._unique_rows(df[columns].values, self.ascending)
+                return
+
+            # dedup first, so that only the distinct groups need sorting
             items = df[columns].drop_duplicates()
-            self.items = [tuple(x) for x in items.to_records(index=False)]
+            if self.sort:
+                items = items.sort_values(by=columns, ascending=self.ascending)
+            self.items = list(items.itertuples(index=False, name=None))
+
+    @staticmethod
+    def _unique_rows(arr, ascending=True):
+        """Returns the sorted unique rows of a 2d array as a list of tuples."""
+        arr = arr[np.lexsort(arr.T[::-1])]
+        keep = np.ones(len(arr), dtype=bool)
+        keep[1:] = (arr[1:] != arr[:-1]).any(axis=1)
+        rows = arr[keep].tolist()
+        if not ascending:
+            rows.reverse()
+        return [tuple(row) for row in rows]
 
     def _create_attr_map(self, df, columns):
         """Creates map between unique values and available attributes."""
@@ -142,16 +174,14 @@ class AttrSpec(HasProps):
         self._generate_items(df, columns)
         iterable = self._setup_iterable()
 
-        iter_map = {}
-        for item in self.items:
-            item = self._ensure_tuple(item)
-            iter_map[item] = next(iterable)
-        return iter_map
+        return {(item if isinstance(item, tuple) else (item,)): attr
+                for item, attr in zip(self.items, iterable)}
 
     def set_columns(self, columns):
         """Set columns property and update derived properties as needed."""
         columns = self._ensure_list(columns)
-        if all([col in self.data.column_names for col in columns]):
+        names = self.data.column_names
+        if all(col in names for col in columns):
             self.columns = columns
         else:
             # we have input values other than columns
@@ -168,19 +198,52 @@ class AttrSpec(HasProps):
                 self.set_columns(columns)
 
         if self.columns is not None and self.data is not None:
+
+            # skip rebuilding the attr map if nothing it depends on has changed
+            if not self._attr_map_stale and self.attr_map:
+                return
+
             self.attr_map = self._create_attr_map(self.data.to_df(), self.columns)
+            self._attr_map_stale = False
+
+            # map each group label to the exact key object used in attr_map. a
+            # tuple label is always the full key, so only scalars are unwrapped
+            self._key_cache = {}
+            for key in self.attr_map:
+                if len(key) != 1:
+                    self._key_cache[key] = key
+                elif not isinstance(key[0], tuple):
+                    self._key_cache[key[0]] = key
+
+    def trigger(self, attr, old, new):
+        """Marks `attr_map` as stale when a property it is derived from changes.
+
+        This is called by the property machinery on assignment, and also when a
+        list property such as `iterable` or `items` is modified in place.
+        """
+        if attr in ('data', 'columns', 'iterable', 'items', 'sort', 'ascending'):
+            self._attr_map_stale = True
 
     def __getitem__(self, item):
         """Lookup the attribute to use for the given unique group label."""
 
         if not self.columns or not self.data or item is None:
             return self.default
-        elif self._ensure_tuple(item) not in self.attr_map.keys():
+
+        try:
+            key = self._key_cache[item]
+        except KeyError:
+            # only labels found in attr_map are cached, when it is built
+            key = item if isinstance(item, tuple) else (item,)
+
+        attr_map = self.attr_map
+        if key not in attr_map:
 
             # make sure we have attr map
             self.setup()
+            attr_map = self.attr_map
 
-        return self.attr_map[self._ensure_tuple(item)]
+        return attr_map[key]
 
 
 class ColorAttr(AttrSpec):
@@ -202,7 +265,7 @@ class ColorAttr(AttrSpec):
 class MarkerAttr(AttrSpec):
     """An attribute specification for mapping unique data values to markers."""
     name = 'marker'
-    iterable = List(String, default=list(marker_types.keys()))
+    iterable = List(String, default=None)
 
     def __init__(self, **kwargs):
         iterable = kwargs.pop('markers', None)
@@ -210,6 +273,10 @@ class MarkerAttr(AttrSpec):
             kwargs['iterable'] = iterable
         super(MarkerAttr, self).__init__(**kwargs)
 
+        # default markers are built per instance, rather than in the class body
+        if self.iterable is None:
+            self.iterable = list(marker_types.keys())
+
 
 dashes = DashPattern._values
 
@@ -217,7 +284,7 @@ dashes = DashPattern._values
 class DashAttr(AttrSpec):
     """An attribute specification for mapping unique data values to line dashes."""
     name = 'dash'
-    iterable = List(String, default=dashes)
+    iterable = List(String, default=None)
 
     def __init__(self, **kwargs):
         iterable = kwargs.pop('dash', None)
@@ -225,6 +292,10 @@ class DashAttr(AttrSpec):
             kwargs['iterable'] = iterable
         super(DashAttr, self).__init__(**kwargs)
 
+        # default dashes are built per instance, rather than in the class body
+        if self.iterable is None:
+            self.iterable = list(dashes)
+
 
 class CatAttr(AttrSpec):
     """An attribute specification for mapping unique data values to labels.
@@ -0,0 +1,137 @@
+"""This is the Bokeh charts testing interface.
+
+"""
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2014, Continuum Analytics, Inc. All rights reserved.
+#
+# Powered by the Bokeh Development Team.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import pandas as pd
+import pytest
+
+from bokeh.charts.attributes import AttrSpec, ColorAttr, DashAttr, MarkerAttr, dashes
+from bokeh.charts.utils import marker_types
+from bokeh.models.sources import ColumnDataSource
+
+#-----------------------------------------------------------------------------
+# Classes and functions
+#-----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def attr_df():
+    return pd.DataFrame({'cat': ['x', 'y', 'x', 'z'], 'num': [1, 2, 1, 3]})
+
+
+def test_setup_skips_rebuild_when_unchanged(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    spec.setup()
+    attr_map = spec.attr_map
+    spec.setup()
+    assert spec.attr_map is attr_map
+    assert spec.attr_map == {('x',): 'red', ('y',): 'blue', ('z',): 'red'}
+
+
+def test_setup_rebuilds_after_set_columns_changes_iterable(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    spec.setup()
+    spec.setup(data=spec.data, columns=['green', 'black'])
+    assert spec.attr_map == {('x',): 'green', ('y',): 'black', ('z',): 'green'}
+
+
+def test_setup_rebuilds_after_iterable_modified_in_place(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    spec.setup()
+    spec.iterable[0] = 'green'
+    spec.setup()
+    assert spec.attr_map == {('x',): 'green', ('y',): 'blue', ('z',): 'green'}
+
+
+def test_setup_rebuilds_after_items_reassigned(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    spec.setup()
+    spec.items = [('z',), ('y',), ('x',)]
+    spec.setup()
+    assert spec.attr_map == {('z',): 'red', ('y',): 'blue', ('x',): 'red'}
+
+
+def test_items_match_data_source_round_trip():
+    df = pd.DataFrame({'cat': pd.Categorical(['b', 'a', 'c', 'a'],
+                                             categories=['c', 'b', 'a'])})
+    spec = ColorAttr(df=df, columns='cat')
+    spec.setup()
+
+    round_trip = ColorAttr(columns='cat')
+    round_trip._generate_items(ColumnDataSource(df).to_df(), ['cat'])
+    assert spec.items == round_trip.items == [('a',), ('b',), ('c',)]
+
+
+def test_setup_uses_data_edited_in_place(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    spec.setup()
+
+    spec.data.data['cat'] = ['q', 'q', 'r', 'r']
+    spec.items = []
+    spec.setup()
+    assert spec.attr_map == {('q',): 'red', ('r',): 'blue'}
+
+
+def test_marker_and_dash_default_iterables():
+    assert MarkerAttr().iterable == list(marker_types.keys())
+    assert MarkerAttr(markers=['x']).iterable == ['x']
+    assert DashAttr().iterable == list(dashes)
+    assert DashAttr(dash=['dashed']).iterable == ['dashed']
+
+
+def pandas_items(df, columns, ascending):
+    """Items as computed by the generic pandas path of _generate_items."""
+    items = df[columns].drop_duplicates().sort_values(by=columns, ascending=ascending)
+    return list(items.itertuples(index=False, name=None))
+
+
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('df', [
+    pd.DataFrame({'a': [3, 1, 3, 2, 1], 'b': [0, 5, 0, 4, 6]}),
+    pd.DataFrame({'a': [True, False, True, True], 'b': [False, True, True, False]}),
+    pd.DataFrame({'a': [1, 1, 1], 'b': [2, 2, 2]}),
+    pd.DataFrame({'a': [], 'b': []}, dtype='int64'),
+])
+def test_integer_multi_column_items_match_pandas(df, ascending):
+    spec = ColorAttr(columns=['a', 'b'], ascending=ascending)
+    spec._generate_items(df, ['a', 'b'])
+    assert spec.items == pandas_items(df, ['a', 'b'], ascending)
+
+
+def test_lookup_keys_are_shared_and_not_cached_on_miss(attr_df):
+    spec = ColorAttr(df=attr_df, columns='cat', palette=['red', 'blue'])
+    assert spec['y'] == 'blue'
+    assert spec._key_cache['y'] is next(key for key in spec.attr_map if key == ('y',))
+
+    cached = dict(spec._key_cache)
+    with pytest.raises(KeyError):
+        spec['missing']
+    assert spec._key_cache == cached
+
+
+def test_set_columns_accepts_unhashable_iterable_values(attr_df):
+    spec = AttrSpec(df=attr_df, columns='cat', iterable=[[1, 2], [3, 4]])
+    spec.setup(data=spec.data, columns=[[5, 6], [7, 8]])
+    assert spec.iterable == [[5, 6], [7, 8]]
+    assert spec.default == [5, 6]
+
+
+def test_tuple_label_is_not_unwrapped_for_single_column():
+    df = pd.DataFrame({'pair': [('p', 'q'), ('r', 's')]})
+    spec = ColorAttr(df=df, columns='pair', palette=['red', 'blue'])
+    assert spec[(('p', 'q'),)] == 'red'
+    with pytest.raises(KeyError):
+        spec[('p', 'q')]
@@ -39,14 +39,7 @@ class Server(object):
         self._port = DEFAULT_SERVER_PORT
         if 'port' in kwargs:
             self._port = kwargs['port']
-        # these queue a callback on the ioloop rather than
-        # doing the operation immediately (I think - havocp)
-        try:
-            self._http.bind(self._port)
-            self._http.start(1)
-        except OSError:
-            log.critical("Cannot start bokeh server, port %s already in use" % self._port)
-            sys.exit(1)
+        self._listening = False
 
     # TODO this is broken, it's only used by test_client_server.py so fix that then remove this
     @property
@@ -61,6 +54,28 @@ class Server(object):
     def io_loop(self):
         return self._tornado.io_loop
 
+    def listen(self):
+        ''' Bind the Bokeh Server to its port, if not already listening.
+
+        This is called by :meth:`start`, and only needs to be called directly
+        when the IO loop is driven by something other than :meth:`start`.
+
+        Returns:
+            None
+
+        '''
+        if self._listening:
+            return
+        # these queue a callback on the ioloop rather than
+        # doing the operation immediately (I think - havocp)
+        try:
+            self._http.bind(self._port)
+            self._http.start(1)
+        except OSError:
+            log.critical("Cannot start bokeh server, port %s already in use" % self._port)
+            sys.exit(1)
+        self._listening = True
+
     def start(self):
         ''' Start the Bokeh Server's IO loop.
 
@@ -71,6 +86,7 @@ class Server(object):
             Keyboard interrupts or sigterm will cause the server to shut down.
 
         '''
+        self.listen()
         self._tornado.start()
 
     def stop(self):
@@ -0,0 +1,30 @@
+from __future__ import absolute_import
+
+from mock import patch
+import unittest
+
+from bokeh.application import Application
+from bokeh.server.server import Server
+
+@patch('bokeh.server.server.BokehTornado')
+@patch('bokeh.server.server.HTTPServer')
+class TestServerListen(unittest.TestCase):
+
+    def test_init_does_not_bind(self, mock_http, mock_tornado):
+        Server(Application(), port=5007)
+        self.assertFalse(mock_http.return_value.bind.called)
+        self.assertFalse(mock_http.return_value.start.called)
+
+    def test_listen_binds_once(self, mock_http, mock_tornado):
+        server = Server(Application(), port=5007)
+        server.listen()
+        server.listen()
+        mock_http.return_value.bind.assert_called_once_with(5007)
+        mock_http.return_value.start.assert_called_once_with(1)
+
+    def test_start_after_listen_binds_once(self, mock_http, mock_tornado):
+        server = Server(Application(), port=5007)
+        server.listen()
+        server.start()
+        mock_http.return_value.bind.assert_called_once_with(5007)
+        mock_tornado.return_value.start.assert_called_once_with()
@@ -28,6 +28,7 @@ class ManagedServerLoop(object):
         loop = IOLoop()
         loop.make_current()
         self._server = Server(application, io_loop=loop)
+        self._server.listen()
     def __exit__(self, type, value, traceback):
         self._server.unlisten()
         self._server.io_loop.close()
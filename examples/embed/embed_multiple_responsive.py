@@ -4,13 +4,13 @@ from bokeh.embed import components
 from bokeh.resources import INLINE
 
 from jinja2 import Template
-import random
+import numpy as np
 
 ########## BUILD FIGURES ################
 
 PLOT_OPTIONS = dict(plot_width=800, plot_height=300)
 SCATTER_OPTIONS = dict(size=12, alpha=0.5)
-data = lambda: [random.choice([i for i in range(100)]) for r in range(10)]
+data = lambda: np.random.randint(0, 100, size=10)
 red = figure(responsive=True, tools='pan', **PLOT_OPTIONS)
 red.scatter(data(), data(), color="red", **SCATTER_OPTIONS)
 blue = figure(responsive=False, tools='pan', **PLOT_OPTIONS)
@@ -503,7 +503,7 @@ REQUIRES = [
         'python-dateutil>=2.1',
         'Jinja2>=2.7',
         'numpy>=1.7.1',
-        'pandas>=0.11.0',
+        'pandas>=0.17.1',
         'Flask>=0.10.1',
         'pyzmq>=14.3.1',
         'tornado>=4.0.1',